@@ -1,7 +1,7 @@
 """CSV Profiler - A tool for analyzing and profiling CSV files."""
 
-from .profiler import profile_csv
-from .render import generate_json_report, generate_markdown_report
+from .profiler import profile_chunks, profile_csv
+from .render import build_view, generate_json_report, generate_markdown_report, stream_json_report
 
 __version__ = "0.1.0"
-__all__ = ["profile_csv", "generate_json_report", "generate_markdown_report"]
+__all__ = ["profile_csv", "profile_chunks", "build_view", "generate_json_report", "generate_markdown_report", "stream_json_report"]
@@ -2,29 +2,35 @@
 
 import sys
 from pathlib import Path
-import importlib.util
 
+import pandas as pd
 import streamlit as st
 
 # Handle imports for both direct execution and package import
 try:
-    from .io import parse_csv_string
+    from .io import parse_csv_bytes, sniff_dialect
     from .profiler import profile_csv
-    from .render import generate_json_report, generate_markdown_report
+    from .render import build_view, generate_json_bytes, generate_markdown_report
 except ImportError:
-    # When run directly by streamlit, load modules from local directory
-    _pkg_dir = Path(__file__).parent
+    # When run directly by streamlit there is no parent package: put the project
+    # root on sys.path once and import absolutely, so reruns hit sys.modules
+    _root = str(Path(__file__).resolve().parents[2])
+    if _root not in sys.path:
+        sys.path.insert(0, _root)
+    from src.csv_profiler.io import parse_csv_bytes, sniff_dialect
+    from src.csv_profiler.profiler import profile_csv
+    from src.csv_profiler.render import build_view, generate_json_bytes, generate_markdown_report
+
+
+# cache_resource hands back the same objects on every rerun; cache_data would
+# unpickle a fresh copy of every cell each time a widget is touched. The cache is
+# shared by every session on the server, so keep only a few recent uploads, briefly.
+@st.cache_resource(show_spinner=False, max_entries=8, ttl=3600)
+def load_csv(file_id, name, size, _data):
+    """Parse an upload once; reruns keyed on the same file reuse the result (read-only)."""
+    delimiter, quotechar = sniff_dialect(_data)
+    return parse_csv_bytes(_data, delimiter, quotechar)
 
-    # Load local io.py (can't use 'import io' as it shadows stdlib)
-    _spec = importlib.util.spec_from_file_location("csv_io", _pkg_dir / "io.py")
-    _csv_io = importlib.util.module_from_spec(_spec)
-    _spec.loader.exec_module(_csv_io)
-    parse_csv_string = _csv_io.parse_csv_string
-
-    # Load other modules normally
-    sys.path.insert(0, str(_pkg_dir))
-    from profiler import profile_csv
-    from render import generate_json_report, generate_markdown_report
 
 # Page configuration
 st.set_page_config(page_title="CSV Profiler", layout="wide")
@@ -35,18 +41,28 @@ st.markdown("Upload a CSV file to analyze its structure and statistics.")
 uploaded = st.file_uploader("Upload CSV", type=["csv"])
 
 if uploaded:
-    # Parse the uploaded CSV file
-    text = uploaded.getvalue().decode("utf-8")
-    rows = parse_csv_string(text)
+    # Parse the uploaded CSV file (cached across reruns)
+    header, columns = load_csv(uploaded.file_id, uploaded.name, uploaded.size, uploaded.getvalue())
+    n_rows = len(columns[0]) if columns else 0
 
     # Show basic file info
-    st.info(f"Loaded **{len(rows)}** rows from `{uploaded.name}`")
+    st.info(f"Loaded **{n_rows}** rows from `{uploaded.name}`")
 
     # Profile button
     if st.button("Generate Profile", type="primary"):
-        # Run profiling and store in session state
-        profile = profile_csv(rows)
+        # Run profiling and render the reports once; reruns read them from session state
+        profile = profile_csv(header, columns)
+        view = build_view(profile)
         st.session_state["profile"] = profile
+        # One DataFrame for st.dataframe's virtualized grid instead of an HTML table
+        st.session_state["table"] = pd.DataFrame(list(view))
+        md_report = generate_markdown_report(profile, view)
+        json_bytes = generate_json_bytes(profile)
+        st.session_state["md"] = md_report
+        st.session_state["json"] = json_bytes.decode("utf-8")
+        # Download buttons get bytes so streamlit doesn't re-encode the reports on every rerun
+        st.session_state["md_bytes"] = md_report.encode("utf-8")
+        st.session_state["json_bytes"] = json_bytes
 
     # Display results if profile exists
     if "profile" in st.session_state:
@@ -64,51 +80,28 @@ if uploaded:
         # Tab 1: Interactive table view
         with tab_table:
             st.subheader("Column Details")
-            # Build a simple table from column profiles
-            table_data = []
-            for col in profile['columns']:
-                n_rows = profile['n_rows']
-                missing_pct = (col['missing'] / n_rows * 100) if n_rows else 0
-                row = {
-                    "Column": col['name'],
-                    "Type": col['type'],
-                    "Missing": f"{col['missing']} ({missing_pct:.1f}%)",
-                    "Unique": col['unique'],
-                }
-                # Add stats based on type
-                if col['type'] == 'number':
-                    row["Min"] = col.get('min', '-')
-                    row["Max"] = col.get('max', '-')
-                    row["Mean"] = f"{col.get('mean', 0):.2f}" if col.get('mean') else '-'
-                else:
-                    # Show top values for text columns
-                    top = col.get('top', [])
-                    top_str = ", ".join([f"{t['value']} ({t['count']})" for t in top[:3]])
-                    row["Top Values"] = top_str if top_str else '-'
-                table_data.append(row)
-
-            st.table(table_data)
+            st.dataframe(st.session_state["table"], hide_index=True)
 
         # Tab 2: Markdown report
         with tab_markdown:
-            md_report = generate_markdown_report(profile)
+            md_report = st.session_state["md"]
             st.markdown(md_report)
             # Download button for markdown
             st.download_button(
                 label="Download Markdown",
-                data=md_report,
+                data=st.session_state["md_bytes"],
                 file_name=f"{uploaded.name.replace('.csv', '')}_profile.md",
                 mime="text/markdown",
             )
 
         # Tab 3: JSON report
         with tab_json:
-            json_report = generate_json_report(profile)
+            json_report = st.session_state["json"]
             st.code(json_report, language="json")
             # Download button for JSON
             st.download_button(
                 label="Download JSON",
-                data=json_report,
+                data=st.session_state["json_bytes"],
                 file_name=f"{uploaded.name.replace('.csv', '')}_profile.json",
                 mime="application/json",
             )
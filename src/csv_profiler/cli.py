@@ -7,9 +7,9 @@ from typing import Optional
 
 import typer
 
-from .io import read_csv_file
-from .profiler import profile_csv
-from .render import generate_json_report, generate_markdown_report
+from .io import CsvView, available_engines, read_csv_file, read_csv_parallel
+from .profiler import profile_chunks, profile_csv
+from .render import generate_json_report, generate_markdown_report, stream_json_report
 
 # Create the CLI app
 app = typer.Typer(help="CSV Profiler - Analyze and profile CSV files")
@@ -20,11 +20,26 @@ def profile(
     csv_file: Path = typer.Argument(..., help="Path to the CSV file to profile", exists=True),
     out_dir: Optional[Path] = typer.Option(None, "--out-dir", "-o", help="Output directory for reports"),
     format: str = typer.Option("json", "--format", "-f", help="Output format: json, markdown, or both"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Parse with N worker processes using the python parser (loads the whole file)"),
+    engine: str = typer.Option("auto", "--engine", "-e", help="CSV parser: auto, pyarrow, polars, or python (streaming)"),
 ) -> None:
     """Profile a CSV file and generate statistics."""
-    # Read and profile the CSV
-    rows = read_csv_file(csv_file)
-    result = profile_csv(rows)
+    if engine != "auto" and engine not in available_engines():
+        raise typer.BadParameter(f"choose from auto, {', '.join(available_engines())}", param_hint="--engine")
+    if workers > 1 and engine not in ("auto", "python"):
+        raise typer.BadParameter("--workers uses the python parser; drop --engine or pass --engine python", param_hint="--engine")
+
+    if workers > 1:
+        # Parse byte ranges in parallel, then profile the combined columns
+        header, columns = read_csv_parallel(csv_file, workers)
+        result = profile_csv(header, columns)
+    elif engine == "python" or (engine == "auto" and available_engines() == ["python"]):
+        # Stream the CSV through the profiler chunk by chunk
+        result = profile_chunks(CsvView(csv_file))
+    else:
+        # Let the columnar engine parse the whole file natively
+        header, columns = read_csv_file(csv_file, engine)
+        result = profile_csv(header, columns)
 
     # Create output directory if specified
     if out_dir:
@@ -32,13 +47,13 @@ def profile(
 
     # Output JSON report
     if format in ("json", "both"):
-        json_report = generate_json_report(result)
         if out_dir:
             path = out_dir / f"{csv_file.stem}_profile.json"
-            path.write_text(json_report, encoding="utf-8")
+            with path.open("wb") as fp:
+                stream_json_report(result, fp)
             typer.echo(f"JSON report saved to: {path}")
         else:
-            typer.echo(json_report)
+            typer.echo(generate_json_report(result))
 
     # Output Markdown report
     if format in ("markdown", "md", "both"):
@@ -60,14 +75,14 @@ def info(
     csv_file: Path = typer.Argument(..., help="Path to the CSV file", exists=True),
 ) -> None:
     """Show basic info about a CSV file without full profiling."""
-    rows = read_csv_file(csv_file)
+    # Only the header is parsed; rows are counted without splitting them into fields
+    view = CsvView(csv_file)
 
-    if rows:
-        columns = list(rows[0].keys())
+    if len(view):
         typer.echo(f"File: {csv_file}")
-        typer.echo(f"Rows: {len(rows)}")
-        typer.echo(f"Columns: {len(columns)}")
-        typer.echo(f"Column names: {', '.join(columns)}")
+        typer.echo(f"Rows: {len(view)}")
+        typer.echo(f"Columns: {len(view.header)}")
+        typer.echo(f"Column names: {', '.join(view.header)}")
     else:
         typer.echo("Empty CSV file")
 
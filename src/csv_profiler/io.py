@@ -1,33 +1,550 @@
 """I/O utilities for reading and parsing CSV files."""
 
-from io import StringIO
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
+from typing import Iterator, Optional, Union
 import csv
+import importlib.util
+import mmap
+import os
+import re
 
+# pyarrow (which ships with streamlit) and polars are optional and slow to import,
+# so they are imported only when a file is actually parsed with them
 
-def parse_csv_string(csv_text: str) -> list[dict]:
+
+def rows_view(table) -> tuple[list[str], list[list[str]]]:
     """
-    Parse CSV text into a list of dictionaries.
+    Convert a pyarrow Table into the columnar shape profile_csv expects.
+
+    Args:
+        table: pyarrow Table whose columns are all strings
+
+    Returns:
+        Tuple of (header, columns) where columns[i] holds the values of header[i]
+    """
+    header = list(table.column_names)
+    columns = [table.column(i).to_pylist() for i in range(table.num_columns)]
+    return header, columns
+
+
+@lru_cache(maxsize=None)
+def _arrow_options(delimiter: str = ",", quotechar: str = '"'):
+    """Build pyarrow's parse options once per dialect."""
+    from pyarrow import csv as pa_csv
+
+    return pa_csv.ParseOptions(delimiter=delimiter, quote_char=quotechar, newlines_in_values=True)
+
+
+def _read_arrow(
+    source: Union[bytes, Path], header: list[str], delimiter: str = ",", quotechar: str = '"'
+) -> Optional[tuple[list[str], list[list[str]]]]:
+    """
+    Parse CSV bytes or a file with pyarrow's multithreaded reader, keeping every cell as text.
+
+    Returns None if arrow rejects the input (e.g. rows with a varying number of fields).
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    if isinstance(source, bytes):
+        stream = pa.BufferReader(source)
+    else:
+        # Let arrow parse straight out of the page cache instead of copying through a file buffer
+        stream = pa.memory_map(str(source))
+    try:
+        with stream:
+            table = pa_csv.read_csv(
+                stream,
+                # Name the columns from the csv module's header and skip arrow's own parse of it,
+                # which strips a UTF-8 BOM and would miss the string override for that column
+                read_options=pa_csv.ReadOptions(
+                    use_threads=True, block_size=8 << 20, column_names=header, skip_rows_after_names=1
+                ),
+                parse_options=_arrow_options(delimiter, quotechar),
+                convert_options=pa_csv.ConvertOptions(
+                    # Profiling does its own type inference, so don't let arrow convert
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+    except pa.ArrowInvalid:
+        return None
+    return rows_view(table)
+
+
+def _slow_parse(f, **fmtparams) -> tuple[list[str], list[list[str]]]:
+    """Parse CSV with the stdlib reader (handles ragged rows pyarrow rejects)."""
+    reader = csv.reader(f, **fmtparams)
+    header = next(reader, None) or []
+    columns = [[] for _ in header]
+    _append_rows(reader, columns)
+    return header, columns
+
+
+def parse_csv_string(csv_text: str) -> tuple[list[str], list[list[str]]]:
+    """
+    Parse CSV text into columns.
 
     Args:
         csv_text: CSV content as string
 
     Returns:
-        List of dicts (each dict is one row)
+        Tuple of (header, columns) where columns[i] holds the values of header[i]
     """
-    reader = csv.DictReader(StringIO(csv_text))
-    return list(reader)
+    return parse_csv_bytes(csv_text.encode("utf-8"))
 
 
-def read_csv_file(file_path: Path) -> list[dict]:
+def parse_csv_bytes(
+    buf: bytes, delimiter: str = ",", quotechar: str = '"'
+) -> tuple[list[str], list[list[str]]]:
     """
-    Read a CSV file and return rows as a list of dictionaries.
+    Parse UTF-8 encoded CSV bytes into columns without decoding them to a str first.
+
+    Args:
+        buf: CSV content as bytes (e.g. an uploaded file)
+        delimiter: Field separator
+        quotechar: Character used to quote fields
+
+    Returns:
+        Tuple of (header, columns) where columns[i] holds the values of header[i]
+    """
+    return make_parser(delimiter, quotechar)(buf)
+
+
+@lru_cache(maxsize=None)
+def make_parser(delimiter: str = ",", quotechar: str = '"'):
+    """
+    Build a bytes -> (header, columns) parser for one CSV dialect.
+
+    Parsers are cached per dialect, so repeated calls reuse the same
+    reader options instead of rebuilding them for every upload.
+
+    Args:
+        delimiter: Field separator
+        quotechar: Character used to quote fields
+
+    Returns:
+        Callable taking CSV bytes and returning (header, columns)
+    """
+    fmtparams = {"delimiter": delimiter, "quotechar": quotechar}
+
+    def parse(buf: bytes) -> tuple[list[str], list[list[str]]]:
+        header = next(csv.reader(_text_stream(buf), **fmtparams), None)
+        if header and "pyarrow" in available_engines():
+            result = _read_arrow(buf, header, delimiter, quotechar)
+            if result is not None:
+                return result
+        return _slow_parse(_text_stream(buf), **fmtparams)
+
+    return parse
+
+
+def sniff_dialect(sample: bytes) -> tuple[str, str]:
+    """
+    Guess the delimiter and quote character from the start of a CSV file.
+
+    Args:
+        sample: Leading bytes of the file (only the first 4 KiB are inspected)
+
+    Returns:
+        Tuple of (delimiter, quotechar), defaulting to comma and double quote
+    """
+    text = sample[:4096].decode("utf-8", errors="ignore")
+    try:
+        dialect = csv.Sniffer().sniff(text, delimiters=",;\t|")
+    except csv.Error:
+        return ",", '"'
+    return dialect.delimiter, dialect.quotechar or '"'
+
+
+def _text_stream(buf: bytes) -> TextIOWrapper:
+    """Wrap bytes in a text stream that decodes lazily as the csv reader pulls lines."""
+    return TextIOWrapper(BytesIO(buf), encoding="utf-8", newline="")
+
+
+def available_engines() -> list[str]:
+    """Names of the CSV parsers usable here, in the order auto mode tries them ("python" always works)."""
+    # find_spec locates a package without importing it
+    engines = [name for name in ("pyarrow", "polars") if importlib.util.find_spec(name) is not None]
+    engines.append("python")
+    return engines
+
+
+def _read_polars(file_path: Path, header: list[str]) -> Optional[tuple[list[str], list[list[str]]]]:
+    """Parse a file with polars, or return None if its result wouldn't match the csv module's."""
+    import polars as pl
+
+    # polars ends lines only at \n, whereas csv.reader also ends them at a lone \r, and
+    # the two disagree on quotes that aren't around a whole field
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if _LONE_CR.search(mm) or _PLAIN_QUOTING.match(mm).end() != len(mm):
+            return None
+    try:
+        df = pl.read_csv(file_path, infer_schema_length=0)  # every column as text
+    except pl.exceptions.PolarsError:
+        return None
+    if df.columns != header:
+        return None  # polars renames duplicate and BOM-prefixed names
+    # Blank lines come back as all-null rows (indistinguishable from ",,"), whereas csv skips them
+    if df.height and df.select(pl.all_horizontal(pl.all().is_null()).any()).item():
+        return None
+    return header, [df.to_series(i).fill_null("").to_list() for i in range(df.width)]
+
+
+def read_csv_file(file_path: Path, engine: str = "auto") -> tuple[list[str], list[list[str]]]:
+    """
+    Read a CSV file and return its columns.
+
+    Uses the installed columnar engines (pyarrow, then polars) and falls back
+    to the stdlib csv module for files those can't parse the same way
+    (e.g. rows with a varying number of fields).
 
     Args:
         file_path: Path to the CSV file
+        engine: "auto", or one of available_engines() to prefer that parser
 
     Returns:
-        List of dicts (each dict is one row)
+        Tuple of (header, columns) where columns[i] holds the values of header[i]
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+    if engine == "auto":
+        engines = available_engines()
+    elif engine in available_engines():
+        engines = [engine]
+    else:
+        raise ValueError(f"CSV engine {engine!r} is not available; choose from {available_engines()}")
+
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        header = next(csv.reader(f), None)
+    readers = {"pyarrow": _read_arrow, "polars": _read_polars}
+    for name in engines:
+        if header and name in readers:
+            result = readers[name](file_path, header)
+            if result is not None:
+                return result
+    return read_csv_columns(file_path)
+
+
+def read_csv_columns(file_path: Path) -> tuple[list[str], list[list[str]]]:
+    """
+    Read a CSV file into columns using only the stdlib csv module.
+
+    Args:
+        file_path: Path to the CSV file
+
+    Returns:
+        Tuple of (header, columns) where columns[i] holds the values of header[i]
+    """
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        return _slow_parse(f)
+
+
+# A quoted field the way csv.reader reads one: the quote opens it only at the start of a
+# field, "" inside is an escaped quote, and it closes at a quote followed by anything else
+# (a quote right at the end of the data may still be the first half of a "")
+# (each pattern matches the quote first and then looks behind it, so re can jump
+# straight to the next quote instead of testing the lookbehind at every byte)
+_QUOTED_FIELD = rb'"(?<![^,\r\n]")[^"]*(?:""[^"]*)*"(?=[^"])'
+# Everything before the first quoted field that is still open: unquoted text, complete
+# quoted fields, and quotes in the middle of an unquoted field (which are literal)
+_OUTSIDE_QUOTES = re.compile(rb'[^"]*(?:(?:' + _QUOTED_FIELD + rb'|"(?<=[^,\r\n]"))[^"]*)*')
+# Inside a quoted field: an even run is all escaped quotes, an odd run closes the field
+_QUOTE_RUN = re.compile(rb'"+')
+# What csv.reader treats as the end of a line
+_LINE_END = re.compile(rb"\r\n?|\n")
+_LONE_CR = re.compile(rb"\r(?!\n)")
+# Data whose quotes all wrap whole fields, each closed right before a delimiter or line end
+_PLAIN_QUOTING = re.compile(rb'[^"]*(?:"(?<![^,\r\n]")[^"]*(?:""[^"]*)*"(?![^,\r\n])[^"]*)*')
+
+
+def _scan_quotes(buf, pos: int, end: int, in_quotes: bool) -> tuple[int, bool]:
+    """
+    Advance through buf[pos:end], tracking whether the scan is inside a quoted field.
+
+    Returns (offset reached, in_quotes). Call again from that offset with a
+    larger end to continue, so each byte is scanned only about once.
+    """
+    while True:
+        if not in_quotes:
+            pos = _OUTSIDE_QUOTES.match(buf, pos, end).end()
+            if pos == end:
+                return end, False
+            pos += 1  # step past the quote that opens the field
+            in_quotes = True
+        run = _QUOTE_RUN.search(buf, pos, end)
+        if run is None:
+            return end, True
+        if run.end() == end:
+            return run.start(), True  # the run may go on past end
+        pos = run.end()
+        in_quotes = (run.end() - run.start()) % 2 == 0
+
+
+def _block_ranges(mm, chunk_bytes: int, start: int = 0) -> Iterator[tuple[int, int]]:
+    """
+    Yield (start, end) byte ranges of roughly chunk_bytes that end on a record boundary.
+
+    A range is cut at the first line ending after chunk_bytes that is not
+    inside a quoted field, so quoted values containing newlines are never
+    split across ranges.
+    """
+    size = len(mm)
+    while start < size:
+        end = min(start + chunk_bytes - 1, size)  # the chunk's last byte may end a line
+        scanned, in_quotes = start, False
+        while end < size:
+            line_end = _LINE_END.search(mm, end)
+            end = size if line_end is None else line_end.end()
+            scanned, in_quotes = _scan_quotes(mm, scanned, end, in_quotes)
+            if not in_quotes:
+                break
+        yield start, end
+        start = end
+
+
+def _read_header(mm) -> tuple[list[str], int]:
+    """Parse the header record and return it with the offset where data starts."""
+    for start, end in _block_ranges(mm, 1):
+        header = next(csv.reader(StringIO(mm[start:end].decode("utf-8"), newline="")), None)
+        return header or [], end
+    return [], 0
+
+
+def _append_rows(rows, columns: list[list[str]]) -> None:
+    """Append parsed rows to per-column lists, padding short rows with ''."""
+    n_cols = len(columns)
+    # Bind each list's append once instead of looking it up for every cell
+    appenders = [col.append for col in columns]
+    for row in rows:
+        if not row:
+            continue
+        if len(row) < n_cols:
+            row += [""] * (n_cols - len(row))
+        for append, value in zip(appenders, row):
+            append(value)
+
+
+def _parse_block(block: bytes, n_cols: int) -> list[list[str]]:
+    """Parse a block of whole records into n_cols column lists."""
+    columns = [[] for _ in range(n_cols)]
+    _append_rows(csv.reader(StringIO(block.decode("utf-8"), newline="")), columns)
+    return columns
+
+
+def iter_csv_chunks(
+    file_path: Path, chunk_bytes: int = 8 << 20
+) -> Iterator[tuple[list[str], list[list[str]]]]:
+    """
+    Stream a CSV file as a sequence of column chunks.
+
+    The file is memory-mapped and parsed chunk_bytes at a time, so memory use
+    is bounded by the chunk size rather than the file size.
+
+    Args:
+        file_path: Path to the CSV file
+        chunk_bytes: Approximate size of each chunk in bytes
+
+    Yields:
+        Tuples of (header, columns) for consecutive runs of rows; the header
+        is read once and repeated for every chunk
+    """
+    with open(file_path, "rb") as f:
+        if not f.seek(0, 2):
+            return  # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header, data_start = _read_header(mm)
+            if not header:
+                return
+            for start, end in _block_ranges(mm, chunk_bytes, data_start):
+                yield header, _parse_block(mm[start:end], len(header))
+
+
+def _parse_range(file_path: Path, start: int, end: int, n_cols: int) -> list[list[str]]:
+    """Worker: map the file and parse the records in [start, end)."""
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            block = mm[start:end]
+    return _parse_block(block, n_cols)
+
+
+def read_csv_parallel(
+    file_path: Path, n_workers: Optional[int] = None
+) -> tuple[list[str], list[list[str]]]:
+    """
+    Read a CSV file by parsing byte ranges in a pool of worker processes.
+
+    The data is split into n_workers ranges aligned to record boundaries;
+    each worker maps the file itself, so only offsets are sent to workers.
+    Results are concatenated in file order.
+
+    Args:
+        file_path: Path to the CSV file
+        n_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Tuple of (header, columns) where columns[i] holds the values of header[i]
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    with open(file_path, "rb") as f:
+        size = f.seek(0, 2)
+        if not size:
+            return [], []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header, data_start = _read_header(mm)
+            chunk_bytes = max(1, -(-(size - data_start) // n_workers))
+            ranges = list(_block_ranges(mm, chunk_bytes, data_start))
+
+    columns = [[] for _ in header]
+    n_cols = [len(header)] * len(ranges)
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(ranges) or 1)) as pool:
+        for part in pool.map(_parse_range, [file_path] * len(ranges), starts, ends, n_cols):
+            for col, values in zip(columns, part):
+                col.extend(values)
+    return header, columns
+
+
+# A newline (optionally after \r) that directly follows another newline: a blank line
+_BLANK_LINE = re.compile(rb"(?<=\n)\r?\n")
+_QUOTED = re.compile(_QUOTED_FIELD)
+# A quote at the start of a field
+_OPEN_QUOTE = re.compile(rb'"(?<![^,\r\n]")')
+
+
+def _count_records(f, chunk_bytes: int) -> Optional[int]:
+    """
+    Count non-empty records from the current position of a binary file.
+
+    Only newlines outside quoted fields end a record, and blank lines are
+    skipped, matching what csv.reader yields. The file is read through a
+    single reused buffer, so memory stays around chunk_bytes.
+
+    Returns None if the records can't be counted this way: a lone \r line
+    ending, or a quoted field that is longer than a chunk or never closed.
+    """
+    buf = bytearray(chunk_bytes)
+    newlines = blanks = 0
+    pending = b""  # the unfinished tail of the last chunk, scanned again with the next one
+    prev = b"\n"  # last two bytes scanned; the start of the data acts like a newline
+    while True:
+        n = f.readinto(buf)
+        at_eof = not n
+        if not at_eof:
+            data = buf if n == chunk_bytes else buf[:n]
+        elif pending or prev[-1:] != b"\n":
+            data = b"\n"  # end the last record as if the file ended with a newline
+        else:
+            break
+        if pending:
+            data = pending + data
+            pending = b""
+        if b'"' in data:
+            # Blank out closed quoted fields, keeping a placeholder so their line isn't
+            # mistaken for a blank one; a lead byte tells the scan whether data starts a field
+            data = _QUOTED.sub(b"q", (b"\n" if prev[-1:] in (b",", b"\r", b"\n") else b" ") + data)
+            # Any quote left at the start of a field opens one that hasn't closed yet
+            open_quote = _OPEN_QUOTE.search(data)
+            if open_quote:
+                pending = data[open_quote.start():]
+                if at_eof or len(pending) > chunk_bytes:
+                    return None
+                data = data[:open_quote.start()]
+            data = data[1:]
+        if data.endswith(b"\r") and not (pending or at_eof):
+            pending, data = b"\r", data[:-1]  # keep a \r\n split across chunks together
+        if not data:
+            continue
+        if b"\r" in data and data.count(b"\r") != data.count(b"\r\n"):
+            return None  # csv.reader ends a record at a lone \r too
+        newlines += data.count(b"\n")
+        # Blank lines whose preceding newline is in prev, then ones wholly inside data
+        head = prev + data[:2]
+        blanks += sum(1 for m in _BLANK_LINE.finditer(head) if m.start() <= len(prev) < m.end())
+        if b"\n\n" in data or (b"\r" in data and b"\n\r\n" in data):
+            blanks += len(_BLANK_LINE.findall(data))
+        prev = bytes((prev + data[-2:])[-2:])
+    return newlines - blanks
+
+
+def read_csv_header_and_count(file_path: Path, chunk_bytes: int = 1 << 20) -> tuple[list[str], int]:
+    """
+    Read the header of a CSV file and count its data rows without parsing them.
+
+    Rows are counted by scanning for record-ending newlines (skipping
+    newlines inside quoted fields and blank lines), which is far cheaper
+    than splitting every row into fields. Files the scan can't follow
+    (see _count_records), or that are dense with quoted fields, are counted
+    with csv.reader instead.
+
+    Args:
+        file_path: Path to the CSV file
+        chunk_bytes: Size of the read buffer in bytes
+
+    Returns:
+        Tuple of (header, number of data rows)
+    """
+    header, data_start = _read_file_header(file_path)
+    if not header:
+        return [], 0
+    with open(file_path, "rb") as f:
+        f.seek(data_start)
+        sample = f.read(chunk_bytes)
+        n_rows = None
+        # Past about one quote in ten bytes, csv.reader beats blanking out the quoted fields
+        if sample.count(b'"') * 10 <= len(sample):
+            f.seek(data_start)
+            n_rows = _count_records(f, chunk_bytes)
+        if n_rows is None:
+            f.seek(data_start)
+            rows = csv.reader(TextIOWrapper(f, encoding="utf-8", newline=""))
+            n_rows = sum(1 for row in rows if row)
+    return header, n_rows
+
+
+def _read_file_header(file_path: Path) -> tuple[list[str], int]:
+    """Read only the header record of a file, plus the offset where data starts."""
+    with open(file_path, "rb") as f:
+        if not f.seek(0, 2):
+            return [], 0  # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _read_header(mm)
+
+
+class CsvView:
+    """
+    Lazy, re-iterable view of a CSV file.
+
+    Nothing is parsed up front. Iterating streams (header, columns) chunks
+    the same way iter_csv_chunks does, so a view can be passed straight to
+    profile_chunks; the header and row count are read on first use and cached.
+
+    Args:
+        file_path: Path to the CSV file
+        chunk_bytes: Approximate size of each chunk in bytes
+    """
+
+    def __init__(self, file_path: Path, chunk_bytes: int = 8 << 20):
+        self.file_path = file_path
+        self.chunk_bytes = chunk_bytes
+        self._header = None
+        self._n_rows = None
+
+    @property
+    def header(self) -> list[str]:
+        """Column names, read from the first record."""
+        if self._header is None:
+            self._header, _ = _read_file_header(self.file_path)
+        return self._header
+
+    def __iter__(self) -> Iterator[tuple[list[str], list[list[str]]]]:
+        return iter_csv_chunks(self.file_path, self.chunk_bytes)
+
+    def __len__(self) -> int:
+        """Number of data rows, counted without parsing them (cached)."""
+        if self._n_rows is None:
+            self._header, self._n_rows = read_csv_header_and_count(self.file_path)
+        return self._n_rows
@@ -1,4 +1,9 @@
 # Assuming we have our profiling functions from Day 2
+from collections import Counter
+import math
+
+import numpy as np
+
 MISSING_VALUES = {"", "na", "n/a", "null", "none", "nan"}
 
 def is_missing(value):
@@ -6,65 +11,90 @@ def is_missing(value):
         return True
     return value.strip().casefold() in MISSING_VALUES
 
-def try_float(value):
+def to_float_array(values):
+    """Parse values into a float64 array, or return None at the first non-number."""
     try:
-        return float(value)
-    except (ValueError, TypeError):
+        return np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+    except ValueError:
         return None
 
-def infer_type(values):
-    usable = [v for v in values if not is_missing(v)]
-    if not usable:
-        return "text"
-    for v in usable:
-        if try_float(v) is None:
-            return "text"
-    return "number"
-
-def numeric_stats(values):
+def new_column_state():
+    """Running counters for one column, updated chunk by chunk."""
+    return {
+        "missing": 0,
+        "counts": Counter(),
+        "is_number": True,
+        "min": None,
+        "max": None,
+    }
+
+def update_column_state(state, values):
     usable = [v for v in values if not is_missing(v)]
-    missing = len(values) - len(usable)
-    nums = [try_float(v) for v in usable if try_float(v) is not None]
-    count = len(nums)
+    state["missing"] += len(values) - len(usable)
+
+    state["counts"].update(usable)
+
+    # A column stays numeric until the first value that isn't a float
+    if state["is_number"] and usable:
+        nums = to_float_array(usable)
+        if nums is None:
+            state["is_number"] = False
+            return
+        lo, hi = float(nums.min()), float(nums.max())
+        state["min"] = lo if state["min"] is None else min(state["min"], lo)
+        state["max"] = hi if state["max"] is None else max(state["max"], hi)
+
+def numeric_stats(state):
+    counts = state["counts"]
+    count = sum(counts.values())
+    # Summed once from the counts with fsum, so the mean doesn't depend on chunking or engine
+    total = math.fsum(float(v) * c for v, c in counts.items())
     return {
         "count": count,
-        "missing": missing,
-        "unique": len(set(nums)),
-        "min": min(nums) if nums else None,
-        "max": max(nums) if nums else None,
-        "mean": sum(nums) / count if count else None,
+        "missing": state["missing"],
+        "unique": int(np.unique(to_float_array(list(counts))).size),
+        "min": state["min"],
+        "max": state["max"],
+        "mean": total / count if count else None,
     }
 
-def text_stats(values, top_k=3):
-    usable = [v for v in values if not is_missing(v)]
-    missing = len(values) - len(usable)
-    counts = {}
-    for v in usable:
-        counts[v] = counts.get(v, 0) + 1
-    sorted_items = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-    top = [{"value": v, "count": c} for v, c in sorted_items[:top_k]]
+def text_stats(state, top_k=3):
+    counts = state["counts"]
+    top = [{"value": v, "count": c} for v, c in counts.most_common(top_k)]
     return {
-        "count": len(usable),
-        "missing": missing,
+        "count": sum(counts.values()),
+        "missing": state["missing"],
         "unique": len(counts),
         "top": top,
     }
 
-def profile_csv(rows):
-    if not rows:
+def profile_chunks(chunks):
+    """Profile a stream of (header, columns) chunks without holding them all in memory."""
+    header = []
+    states = []
+    n_rows = 0
+
+    for chunk_header, columns in chunks:
+        if not states:
+            header = chunk_header
+            states = [new_column_state() for _ in header]
+        n_rows += len(columns[0]) if columns else 0
+        for state, values in zip(states, columns):
+            update_column_state(state, values)
+
+    if not n_rows:
         return {"n_rows": 0, "n_cols": 0, "columns": []}
 
-    columns = list(rows[0].keys())
     col_profiles = []
 
-    for col in columns:
-        values = [row.get(col, "") for row in rows]
-        col_type = infer_type(values)
-
-        if col_type == "number":
-            stats = numeric_stats(values)
+    for col, state in zip(header, states):
+        # Same rule as before: numeric only if every non-missing value parses
+        if state["is_number"] and state["counts"]:
+            col_type = "number"
+            stats = numeric_stats(state)
         else:
-            stats = text_stats(values)
+            col_type = "text"
+            stats = text_stats(state)
 
         col_profiles.append({
             "name": col,
@@ -73,8 +103,10 @@ def profile_csv(rows):
         })
 
     return {
-        "n_rows": len(rows),
-        "n_cols": len(columns),
+        "n_rows": n_rows,
+        "n_cols": len(header),
         "columns": col_profiles
     }
 
+def profile_csv(header, columns):
+    return profile_chunks([(header, columns)])
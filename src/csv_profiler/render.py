@@ -1,10 +1,91 @@
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _orjson_matches_json(value):
+    """Whether orjson would write value exactly as json does.
+
+    orjson writes inf/nan as null, drops the + from exponents (1e16 vs 1e+16)
+    and rejects ints outside 64 bits, so reports holding those go through json.
+    """
+    if isinstance(value, float):
+        return math.isfinite(value) and "e" not in repr(value)
+    if isinstance(value, int):
+        return -(2 ** 63) <= value < 2 ** 64
+    if isinstance(value, dict):
+        return all(_orjson_matches_json(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_orjson_matches_json(v) for v in value)
+    return True
+
+def generate_json_bytes(profile):
+    """Generate JSON report as UTF-8 bytes (orjson when installed and its output is the same)."""
+    if orjson is not None and _orjson_matches_json(profile):
+        return orjson.dumps(profile, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(profile, indent=2, ensure_ascii=False).encode("utf-8")
+
 def generate_json_report(profile):
     """Generate JSON report string."""
-    import json
+    if orjson is not None and _orjson_matches_json(profile):
+        return generate_json_bytes(profile).decode("utf-8")
     return json.dumps(profile, indent=2, ensure_ascii=False)
 
-def generate_markdown_report(profile):
-    """Generate Markdown report string."""
+def stream_json_report(profile, fp):
+    """Write the JSON report to a binary file one column at a time."""
+    fp.write(b"{")
+    for i, (key, value) in enumerate(profile.items()):
+        fp.write(b",\n  " if i else b"\n  ")
+        fp.write(generate_json_bytes(key) + b": ")
+        if key == "columns" and value:
+            # Only one column is ever serialized at once
+            fp.write(b"[")
+            for j, col in enumerate(value):
+                fp.write(b",\n    " if j else b"\n    ")
+                fp.write(generate_json_bytes(col).replace(b"\n", b"\n    "))
+            fp.write(b"\n  ]")
+        else:
+            fp.write(generate_json_bytes(value).replace(b"\n", b"\n  "))
+    fp.write(b"\n}")
+
+def _summary_row(col, n_rows):
+    """Format the columns every view shows: name, type, missing and unique."""
+    missing_pct = (col['missing'] / n_rows * 100) if n_rows else 0
+    return {
+        "Column": col['name'],
+        "Type": col['type'],
+        "Missing": f"{col['missing']} ({missing_pct:.1f}%)",
+        "Unique": col['unique'],
+    }
+
+def build_view(profile):
+    """Pre-format every column once so each renderer can reuse the strings."""
+    n_rows = profile['n_rows']
+    view = []
+    for col in profile['columns']:
+        row = _summary_row(col, n_rows)
+        # Add stats based on type
+        if col['type'] == 'number':
+            row["Min"] = col.get('min', '-')
+            row["Max"] = col.get('max', '-')
+            row["Mean"] = f"{col.get('mean', 0):.2f}" if col.get('mean') else '-'
+        else:
+            # Show top values for text columns
+            top = col.get('top', [])
+            top_str = ", ".join([f"{t['value']} ({t['count']})" for t in top[:3]])
+            row["Top Values"] = top_str if top_str else '-'
+        view.append(row)
+    return tuple(view)
+
+def generate_markdown_report(profile, view=None):
+    """Generate Markdown report string, reusing a build_view() result if given."""
+    if view is None:
+        # Markdown only prints the summary columns, so don't format the rest
+        view = [_summary_row(col, profile['n_rows']) for col in profile['columns']]
+
     lines = []
     lines.append("# CSV Profiling Report")
     lines.append("")
@@ -16,10 +97,8 @@ def generate_markdown_report(profile):
     lines.append("| Column | Type | Missing | Unique |")
     lines.append("|--------|------|--------:|-------:|")
 
-    for col in profile['columns']:
-        n_rows = profile['n_rows']
-        missing_pct = (col['missing'] / n_rows * 100) if n_rows else 0
-        lines.append(f"| {col['name']} | {col['type']} | {col['missing']} ({missing_pct:.1f}%) | {col['unique']} |")
+    for row in view:
+        lines.append(f"| {row['Column']} | {row['Type']} | {row['Missing']} | {row['Unique']} |")
 
     return "\n".join(lines)
 
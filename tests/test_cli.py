@@ -0,0 +1,38 @@
+"""Tests for the command-line option checks."""
+
+import pytest
+from typer.testing import CliRunner
+
+from src.csv_profiler.cli import app
+from src.csv_profiler.io import available_engines
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,y\n", encoding="utf-8")
+    return path
+
+
+def test_unknown_engine(csv_file):
+    result = runner.invoke(app, ["profile", str(csv_file), "--engine", "pandas"])
+    assert result.exit_code == 2
+    assert "choose from auto" in result.output
+
+
+@pytest.mark.parametrize("engine", ["polars", "pyarrow"])
+def test_workers_reject_columnar_engines(csv_file, engine):
+    if engine not in available_engines():
+        pytest.skip(f"{engine} is not installed")
+    result = runner.invoke(app, ["profile", str(csv_file), "--workers", "2", "--engine", engine])
+    assert result.exit_code == 2
+    assert "--workers uses the python parser" in result.output
+
+
+@pytest.mark.parametrize("engine", ["auto", "python"])
+def test_workers_accept_python_engine(csv_file, engine):
+    result = runner.invoke(app, ["profile", str(csv_file), "--workers", "2", "--engine", engine])
+    assert result.exit_code == 0, result.output
+    assert '"n_rows": 2' in result.output
@@ -0,0 +1,199 @@
+"""Check every CSV reader in csv_profiler.io against what csv.reader yields."""
+
+import csv
+import mmap
+import random
+import time
+
+import pytest
+
+from src.csv_profiler.io import (
+    CsvView,
+    _block_ranges,
+    _count_records,
+    _read_file_header,
+    available_engines,
+    iter_csv_chunks,
+    parse_csv_bytes,
+    read_csv_columns,
+    read_csv_file,
+    read_csv_header_and_count,
+    read_csv_parallel,
+    sniff_dialect,
+)
+from src.csv_profiler.profiler import profile_chunks, profile_csv
+
+CASES = {
+    "simple": b"a,b\n1,x\n2,y\n",
+    "no_trailing_newline": b"a,b\n1,x\n2,y",
+    "stray_quote": b'a,b\n1,5"\n2,3\n',
+    "stray_quote_then_multiline": b'a,b\n1,5"\n"x\ny",b\n3,4\n',
+    "quote_after_closed_field": b'a,b\n"ab"c,"d\ne"\n1,2\n',
+    "escaped_quotes": b'a,b\n"he said ""hi""","multi\nline"\n"",x\n',
+    "bom": b"\xef\xbb\xbfid,name\n1,x\n2,y\n",
+    "blank_lines": b"a,b\n\n1,2\n\n\n\n3,4\n\n",
+    "crlf": b'a,b\r\n1,"x\r\ny"\r\n\r\n2,3\r\n',
+    "lone_cr": b"a,b\r1,2\r3,4\r",
+    "ragged": b"a,b,c\n1,2\n3,4,5\n",
+    "quoted_header": b'"x\ny",b\n1,2\n',
+    "open_quote_at_eof": b'a,b\n1,2\n3,"never closed\n4,5\n',
+    "header_only": b"a,b\n",
+    "empty": b"",
+}
+
+
+@pytest.fixture(params=sorted(CASES))
+def csv_path(request, tmp_path):
+    path = tmp_path / f"{request.param}.csv"
+    path.write_bytes(CASES[request.param])
+    return path
+
+
+def expected(path):
+    """(header, columns) built directly from csv.reader, padding short rows with ''."""
+    with open(path, encoding="utf-8", newline="") as f:
+        rows = [row for row in csv.reader(f) if row]
+    header = rows[0] if rows else []
+    columns = [[] for _ in header]
+    for row in rows[1:]:
+        row += [""] * (len(header) - len(row))
+        for col, value in zip(columns, row):
+            col.append(value)
+    return header, columns
+
+
+def concat_chunks(path, chunk_bytes):
+    columns = [[] for _ in CsvView(path).header]
+    for _, chunk in iter_csv_chunks(path, chunk_bytes):
+        for col, values in zip(columns, chunk):
+            col.extend(values)
+    return columns
+
+
+@pytest.mark.parametrize("engine", available_engines())
+def test_read_csv_file(csv_path, engine):
+    assert read_csv_file(csv_path, engine) == expected(csv_path)
+
+
+@pytest.mark.parametrize(
+    "sample, dialect",
+    [
+        (b"a,b,c\n1,2,3\n4,5,6\n", (",", '"')),
+        (b"a;b;c\n1;2;3\n4;5;6\n", (";", '"')),
+        (b"a\tb\tc\n1\t2\t3\n4\t5\t6\n", ("\t", '"')),
+        (b"a|b|c\n1|2|3\n4|5|6\n", ("|", '"')),
+        (b"a;b\n'x;y';2\n'z';3\n", (";", "'")),
+        (b"", (",", '"')),
+        (b"one lonely line", (",", '"')),
+    ],
+    ids=["comma", "semicolon", "tab", "pipe", "single_quote", "empty", "unsniffable"],
+)
+def test_sniff_dialect(sample, dialect):
+    assert sniff_dialect(sample) == dialect
+
+
+def test_parse_csv_bytes_with_sniffed_dialect():
+    buf = b"a;b\n'x;y';2\n'z';3\n"
+    assert parse_csv_bytes(buf, *sniff_dialect(buf)) == (["a", "b"], [["x;y", "z"], ["2", "3"]])
+
+
+def test_read_csv_columns(csv_path):
+    assert read_csv_columns(csv_path) == expected(csv_path)
+
+
+def test_parse_csv_bytes(csv_path):
+    assert parse_csv_bytes(csv_path.read_bytes()) == expected(csv_path)
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 5, 8 << 20])
+def test_iter_csv_chunks(csv_path, chunk_bytes):
+    header, columns = expected(csv_path)
+    assert CsvView(csv_path).header == header
+    assert concat_chunks(csv_path, chunk_bytes) == columns
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'a,b\n"x\n' + b"1,2\n" * 40_000,  # a quote that never closes
+        b'a,b\n1,"' + b"x\n" * 40_000 + b'"\n3,4\n',  # one long quoted field
+    ],
+    ids=["unclosed", "long_field"],
+)
+def test_block_ranges_scan_open_fields_once(tmp_path, data):
+    # Rescanning an open field at every line end made this take minutes
+    path = tmp_path / "open.csv"
+    path.write_bytes(data)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        started = time.perf_counter()
+        ranges = list(_block_ranges(mm, 16, 4))
+        assert time.perf_counter() - started < 2
+    assert ranges[0] == (4, ranges[0][1]) and ranges[-1][1] == len(data)
+    assert all(a_end == b_start for (_, a_end), (b_start, _) in zip(ranges, ranges[1:]))
+
+
+@pytest.mark.parametrize("n_workers", [2, 3])
+def test_read_csv_parallel(csv_path, n_workers):
+    assert read_csv_parallel(csv_path, n_workers) == expected(csv_path)
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 4, 1 << 20])
+def test_read_csv_header_and_count(csv_path, chunk_bytes):
+    header, columns = expected(csv_path)
+    n_rows = len(columns[0]) if columns else 0
+    assert read_csv_header_and_count(csv_path, chunk_bytes) == (header, n_rows)
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 4, 1 << 20])
+def test_count_records_matches_or_gives_up(csv_path, chunk_bytes):
+    # The scan itself, without the csv.reader fallback: a count must be exact
+    header, columns = expected(csv_path)
+    _, data_start = _read_file_header(csv_path)
+    with open(csv_path, "rb") as f:
+        f.seek(data_start)
+        n_rows = _count_records(f, chunk_bytes)
+    if header and n_rows is not None:
+        assert n_rows == len(columns[0])
+
+
+def test_count_records_scans_stray_quotes(tmp_path):
+    path = tmp_path / "stray.csv"
+    path.write_bytes(b"a,b\n" + b'1,5"\n2,3\n' * 1000)
+    _, data_start = _read_file_header(path)
+    with open(path, "rb") as f:
+        f.seek(data_start)
+        assert _count_records(f, 64) == 2000
+
+
+def test_random_files(tmp_path):
+    # Fragments that stress quoting, escaped quotes and every kind of line ending
+    atoms = ["a", "1", " ", "", ",", '"', '""', 'x"y', '"q,\n"', "\n", "\r\n", "\r"]
+    rng = random.Random(0)
+    path = tmp_path / "random.csv"
+    for _ in range(200):
+        text = "h1,h2\n" + "".join(rng.choice(atoms) for _ in range(rng.randint(0, 60)))
+        path.write_text(text, encoding="utf-8", newline="")
+        header, columns = expected(path)
+        for chunk_bytes in (1, 7, 64):
+            assert concat_chunks(path, chunk_bytes) == columns, text
+            assert read_csv_header_and_count(path, chunk_bytes) == (header, len(columns[0])), text
+            with open(path, "rb") as f:
+                f.seek(len(b"h1,h2\n"))
+                assert _count_records(f, chunk_bytes) in (None, len(columns[0])), text
+
+
+@pytest.mark.parametrize("engine", available_engines())
+def test_random_files_every_engine(tmp_path, engine):
+    # Each columnar engine must either match csv.reader or hand the file on to it
+    atoms = ["a", "1", " ", "", ",", '"', '""', 'x"y', '"q,\n"', "\n", "\r\n", "\r"]
+    rng = random.Random(1)
+    path = tmp_path / "random.csv"
+    for _ in range(500):
+        text = "h1,h2\n" + "".join(rng.choice(atoms) for _ in range(rng.randint(0, 60)))
+        path.write_text(text, encoding="utf-8", newline="")
+        assert read_csv_file(path, engine) == expected(path), text
+
+
+def test_streamed_profile_matches_whole_file(csv_path):
+    header, columns = expected(csv_path)
+    assert profile_chunks(CsvView(csv_path, chunk_bytes=5)) == profile_csv(header, columns)
@@ -0,0 +1,40 @@
+"""Tests for the streaming column profiler."""
+
+import math
+import random
+
+from src.csv_profiler.profiler import profile_chunks, profile_csv
+
+
+def test_column_turns_text_in_a_later_chunk():
+    header = ["id", "code"]
+    chunks = [
+        (header, [["1", "2"], ["10", "20"]]),
+        (header, [["3", "4"], ["30", "n/a"]]),
+        (header, [["5", "6"], ["x7", "40"]]),
+    ]
+    profile = profile_chunks(chunks)
+    assert profile == profile_csv(header, [["1", "2", "3", "4", "5", "6"], ["10", "20", "30", "n/a", "x7", "40"]])
+
+    id_col, code_col = profile["columns"]
+    assert id_col["type"] == "number"
+    assert (id_col["min"], id_col["max"], id_col["mean"]) == (1.0, 6.0, 3.5)
+    assert code_col["type"] == "text"
+    assert code_col["missing"] == 1
+    assert code_col["unique"] == 5
+    assert "min" not in code_col
+
+
+def test_no_rows():
+    assert profile_chunks([]) == {"n_rows": 0, "n_cols": 0, "columns": []}
+
+
+def test_mean_does_not_depend_on_chunking():
+    rng = random.Random(0)
+    values = [f"{rng.uniform(0, 100):.2f}" for _ in range(5000)]
+    header = ["price"]
+    means = set()
+    for size in (1, 7, 64, 5000):
+        chunks = [(header, [values[i:i + size]]) for i in range(0, len(values), size)]
+        means.add(profile_chunks(chunks)["columns"][0]["mean"])
+    assert means == {math.fsum(map(float, values)) / len(values)}
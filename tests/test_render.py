@@ -0,0 +1,102 @@
+"""Tests for the JSON and Markdown report renderers."""
+
+import io
+
+import pytest
+
+from src.csv_profiler import render
+from src.csv_profiler.render import (
+    build_view,
+    generate_json_bytes,
+    generate_json_report,
+    generate_markdown_report,
+    stream_json_report,
+)
+
+
+def numeric_profile(lo, hi, mean):
+    return {
+        "n_rows": 3,
+        "n_cols": 1,
+        "columns": [
+            {"name": "x", "type": "number", "count": 3, "missing": 0, "unique": 3, "min": lo, "max": hi, "mean": mean},
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "profile",
+    [
+        numeric_profile(1.0, 2.5, 1.75),
+        numeric_profile(-float("inf"), float("inf"), float("nan")),
+        numeric_profile(1e-07, 1e16, 2.5e15),
+        numeric_profile(0.0, 2 ** 70, None),
+    ],
+    ids=["plain", "non_finite", "exponents", "big_int"],
+)
+def test_json_is_the_same_with_or_without_orjson(profile, monkeypatch):
+    with_orjson = generate_json_bytes(profile)
+    text = generate_json_report(profile)
+    monkeypatch.setattr(render, "orjson", None)
+    assert with_orjson == generate_json_bytes(profile)
+    assert text == generate_json_report(profile) == with_orjson.decode("utf-8")
+
+
+def test_non_finite_numbers_keep_json_spelling():
+    text = generate_json_report(numeric_profile(-float("inf"), float("inf"), float("nan")))
+    assert '"min": -Infinity' in text
+    assert '"max": Infinity' in text
+    assert '"mean": NaN' in text
+
+
+def mixed_profile():
+    return {
+        "n_rows": 4,
+        "n_cols": 2,
+        "columns": [
+            {"name": "price", "type": "number", "count": 3, "missing": 1, "unique": 3, "min": 1.0, "max": 3.0, "mean": 2.0},
+            {
+                "name": "city",
+                "type": "text",
+                "count": 4,
+                "missing": 0,
+                "unique": 2,
+                "top": [{"value": "Oslo", "count": 3}, {"value": "Rome", "count": 1}],
+            },
+        ],
+    }
+
+
+def test_build_view_formats_every_column():
+    price, city = build_view(mixed_profile())
+    assert price == {
+        "Column": "price", "Type": "number", "Missing": "1 (25.0%)", "Unique": 3, "Min": 1.0, "Max": 3.0, "Mean": "2.00",
+    }
+    assert city == {"Column": "city", "Type": "text", "Missing": "0 (0.0%)", "Unique": 2, "Top Values": "Oslo (3), Rome (1)"}
+
+
+def test_markdown_report_is_the_same_with_a_view():
+    profile = mixed_profile()
+    report = generate_markdown_report(profile)
+    assert report == generate_markdown_report(profile, build_view(profile))
+    assert "| price | number | 1 (25.0%) | 3 |" in report.splitlines()
+    assert "| city | text | 0 (0.0%) | 2 |" in report.splitlines()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "profile",
+    [
+        mixed_profile(),
+        numeric_profile(-float("inf"), 1e16, 2.5),
+        {"n_rows": 0, "n_cols": 0, "columns": []},
+        {"n_rows": 1, "n_cols": 1, "columns": [{"name": "ville\n\"é\"", "type": "text", "top": []}]},
+    ],
+    ids=["mixed", "non_finite", "empty", "escapes"],
+)
+def test_stream_json_report_matches_generate_json_bytes(profile, use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(render, "orjson", None)
+    fp = io.BytesIO()
+    stream_json_report(profile, fp)
+    assert fp.getvalue() == generate_json_bytes(profile)